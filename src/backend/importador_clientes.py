@@ -0,0 +1,386 @@
+import os
+import sys
+import csv
+import json
+import sqlite3
+import codecs
+import hashlib
+import argparse
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator
+
+# Adicionar o diretório src ao path para importações
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.backend.logger import logger
+
+# Importação condicional para evitar erro de importação circular
+if TYPE_CHECKING:
+    from src.frontend.controllers.licence_controller import LicenceController
+
+# Nomes de colunas aceitos para cada campo (comparação sem diferenciar maiúsculas)
+COLUNAS_NOME = ('nome', 'cliente', 'nome_cliente')
+COLUNAS_VALIDADE = ('validade', 'dias_validade', 'dias')
+
+# Extensões tratadas como JSON Lines; as demais são lidas como CSV
+EXTENSOES_JSONL = ('.jsonl', '.ndjson')
+
+# Bytes iniciais da entrada usados para identificar o arquivo no checkpoint
+TAMANHO_AMOSTRA_IDENTIFICACAO = 1024 * 1024
+
+# Codificação usada quando a amostra inicial não é UTF-8 válido (CSV do Excel em português)
+ENCODING_ALTERNATIVO = 'cp1252'
+
+
+class ImportadorClientes:
+    """
+    Importa listas de clientes em streaming e emite licenças em lotes.
+
+    As linhas são lidas uma a uma do arquivo de entrada (CSV, CSV do Excel ou
+    JSONL), validadas com as mesmas regras de ``LicenceController.gerar_licenca``
+    e deduplicadas por um conjunto de hashes mantido em SQLite no disco. As
+    licenças são gravadas no arquivo de saída, uma por linha (JSONL), em lotes
+    de ``tamanho_lote`` linhas, de modo que a memória usada não depende do
+    tamanho da lista.
+
+    Ao final de cada lote, a posição na entrada, o tamanho do arquivo de saída
+    e os hashes dos clientes emitidos são confirmados na mesma transação. Após
+    uma falha, uma nova execução com os mesmos arquivos retoma a partir do
+    último lote confirmado. Se o arquivo de entrada for substituído (tamanho
+    ou conteúdo inicial diferentes), a retomada é recusada.
+
+    Attributes:
+        controller (LicenceController): Controlador usado para validar e assinar as licenças.
+        caminho_entrada (str): Arquivo com a lista de clientes.
+        caminho_saida (str): Arquivo JSONL onde as licenças são gravadas.
+        caminho_estado (str): Banco SQLite com o checkpoint e o conjunto de deduplicação.
+        tamanho_lote (int): Quantidade de linhas da entrada processadas por lote.
+        encoding (str): Codificação do arquivo de entrada, detectada se não informada.
+    """
+
+    def __init__(self, controller: 'LicenceController', caminho_entrada: str, caminho_saida: str,
+                 caminho_estado: str = None, tamanho_lote: int = 1000, encoding: str = None):
+        """
+        Inicializa o importador.
+
+        Args:
+            controller (LicenceController): Controlador usado para validar e assinar as licenças.
+            caminho_entrada (str): Arquivo com a lista de clientes.
+            caminho_saida (str): Arquivo JSONL onde as licenças são gravadas.
+            caminho_estado (str, optional): Banco de estado. Padrão é ``<saida>.estado.sqlite``.
+            tamanho_lote (int, optional): Linhas por lote. Padrão é 1000.
+            encoding (str, optional): Codificação da entrada. Se omitida, usa UTF-8 quando
+                o início do arquivo é UTF-8 válido e cp1252 (Excel) caso contrário.
+        """
+        if tamanho_lote <= 0:
+            raise ValueError("Tamanho do lote deve ser um número positivo")
+
+        self.controller = controller
+        self.caminho_entrada = os.path.abspath(caminho_entrada)
+        self.caminho_saida = os.path.abspath(caminho_saida)
+        self.caminho_estado = os.path.abspath(caminho_estado or f"{caminho_saida}.estado.sqlite")
+        self.tamanho_lote = tamanho_lote
+        self.encoding = encoding or self._detectar_encoding()
+        self._identificacao = None
+
+    def executar(self) -> dict:
+        """
+        Processa o arquivo de entrada, retomando do último checkpoint se houver.
+
+        Returns:
+            dict: Contadores de linhas lidas, licenças emitidas, duplicadas e rejeitadas.
+        """
+        conexao = self._abrir_estado()
+        try:
+            linhas_processadas, offset_saida, estatisticas = self._ler_checkpoint(conexao)
+            if linhas_processadas:
+                logger.info(f"Retomando importação de {self.caminho_entrada} a partir da linha {linhas_processadas}")
+
+            # Carregar a chave uma única vez para todo o processamento
+            caminho_privada = self.controller._caminho_chave_privada()
+            if not os.path.exists(caminho_privada):
+                raise FileNotFoundError(f"Chave privada não encontrada: {caminho_privada}")
+            private_key = self.controller._carregar_chave_privada()
+
+            tamanho_saida = os.path.getsize(self.caminho_saida) if os.path.exists(self.caminho_saida) else 0
+            if tamanho_saida < offset_saida:
+                raise ValueError(f"Arquivo de saída {self.caminho_saida} é menor que o checkpoint registrado")
+
+            with open(self.caminho_saida, 'ab') as saida:
+                # Descartar licenças gravadas após o último checkpoint confirmado
+                saida.truncate(offset_saida)
+
+                linhas = islice(self._ler_linhas(), linhas_processadas, None)
+                while True:
+                    lote = list(islice(linhas, self.tamanho_lote))
+                    if not lote:
+                        break
+
+                    registros = []
+                    for numero, linha in enumerate(lote, start=linhas_processadas + 1):
+                        try:
+                            self._verificar_codificacao(linha)
+                            nome, dias_validade = self.controller.validar_dados(*linha)
+                        except ValueError as e:
+                            estatisticas['rejeitadas'] += 1
+                            logger.warning(f"Linha {numero} rejeitada na importação: {e}")
+                            continue
+
+                        if not self._registrar_cliente(conexao, nome):
+                            estatisticas['duplicadas'] += 1
+                            continue
+
+                        licenca = self.controller._criar_licenca(nome, dias_validade, private_key)
+                        registros.append((json.dumps(licenca, ensure_ascii=False) + '\n').encode('utf-8'))
+
+                    # Persistir o lote antes de confirmar o checkpoint
+                    saida.writelines(registros)
+                    saida.flush()
+                    os.fsync(saida.fileno())
+
+                    linhas_processadas += len(lote)
+                    estatisticas['lidas'] += len(lote)
+                    estatisticas['emitidas'] += len(registros)
+                    self._salvar_checkpoint(conexao, linhas_processadas, saida.tell(), estatisticas)
+                    conexao.commit()
+
+            logger.info(
+                f"Importação de {self.caminho_entrada} concluída: {estatisticas['emitidas']} licenças emitidas, "
+                f"{estatisticas['duplicadas']} duplicadas, {estatisticas['rejeitadas']} rejeitadas"
+            )
+            return estatisticas
+
+        except Exception as e:
+            conexao.rollback()
+            logger.error(f"Erro na importação de clientes: {e}")
+            raise
+
+        finally:
+            conexao.close()
+
+    def _abrir_estado(self) -> sqlite3.Connection:
+        """
+        Abre o banco de estado, criando as tabelas se necessário.
+
+        Returns:
+            sqlite3.Connection: Conexão com o banco de estado.
+        """
+        conexao = sqlite3.connect(self.caminho_estado)
+        conexao.execute("PRAGMA journal_mode=WAL")
+        conexao.execute("PRAGMA synchronous=FULL")
+        conexao.execute("CREATE TABLE IF NOT EXISTS clientes (hash BLOB PRIMARY KEY) WITHOUT ROWID")
+        conexao.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoint ("
+            "id INTEGER PRIMARY KEY CHECK (id = 1), entrada TEXT NOT NULL, identificacao TEXT NOT NULL, "
+            "linhas INTEGER NOT NULL, offset_saida INTEGER NOT NULL, estatisticas TEXT NOT NULL)"
+        )
+        conexao.commit()
+        return conexao
+
+    def _ler_checkpoint(self, conexao: sqlite3.Connection) -> tuple:
+        """
+        Lê o último checkpoint confirmado.
+
+        Args:
+            conexao (sqlite3.Connection): Conexão com o banco de estado.
+
+        Returns:
+            tuple: Linhas já processadas, tamanho confirmado da saída e estatísticas acumuladas.
+        """
+        linha = conexao.execute(
+            "SELECT entrada, identificacao, linhas, offset_saida, estatisticas FROM checkpoint WHERE id = 1"
+        ).fetchone()
+        if linha is None:
+            return 0, 0, {'lidas': 0, 'emitidas': 0, 'duplicadas': 0, 'rejeitadas': 0}
+
+        entrada, identificacao, linhas, offset_saida, estatisticas = linha
+        if entrada != self.caminho_entrada:
+            raise ValueError(f"Estado {self.caminho_estado} pertence a outra importação: {entrada}")
+        if identificacao != self._identificar_entrada():
+            raise ValueError(
+                f"Arquivo {self.caminho_entrada} foi alterado desde o último checkpoint. "
+                f"Remova {self.caminho_estado} ou informe outro arquivo de estado para iniciar uma nova importação"
+            )
+        return linhas, offset_saida, json.loads(estatisticas)
+
+    def _salvar_checkpoint(self, conexao: sqlite3.Connection, linhas: int, offset_saida: int, estatisticas: dict):
+        """
+        Registra o checkpoint na transação corrente.
+
+        Args:
+            conexao (sqlite3.Connection): Conexão com o banco de estado.
+            linhas (int): Linhas da entrada já processadas.
+            offset_saida (int): Tamanho do arquivo de saída após o lote.
+            estatisticas (dict): Contadores acumulados.
+        """
+        conexao.execute(
+            "INSERT OR REPLACE INTO checkpoint (id, entrada, identificacao, linhas, offset_saida, estatisticas) "
+            "VALUES (1, ?, ?, ?, ?, ?)",
+            (self.caminho_entrada, self._identificar_entrada(), linhas, offset_saida, json.dumps(estatisticas))
+        )
+
+    def _identificar_entrada(self) -> str:
+        """
+        Identifica o conteúdo do arquivo de entrada pelo tamanho e pelo hash do início.
+
+        Returns:
+            str: Identificação no formato ``<tamanho>:<sha256 da amostra inicial>``.
+        """
+        if self._identificacao is None:
+            with open(self.caminho_entrada, 'rb') as f:
+                amostra = f.read(TAMANHO_AMOSTRA_IDENTIFICACAO)
+            tamanho = os.path.getsize(self.caminho_entrada)
+            self._identificacao = f"{tamanho}:{hashlib.sha256(amostra).hexdigest()}"
+        return self._identificacao
+
+    @staticmethod
+    def _registrar_cliente(conexao: sqlite3.Connection, nome: str) -> bool:
+        """
+        Adiciona o cliente ao conjunto de deduplicação.
+
+        Args:
+            conexao (sqlite3.Connection): Conexão com o banco de estado.
+            nome (str): Nome do cliente já validado.
+
+        Returns:
+            bool: True se o cliente ainda não havia sido registrado.
+        """
+        chave = hashlib.sha256(' '.join(nome.split()).casefold().encode()).digest()
+        cursor = conexao.execute("INSERT OR IGNORE INTO clientes (hash) VALUES (?)", (chave,))
+        return cursor.rowcount == 1
+
+    def _detectar_encoding(self) -> str:
+        """
+        Detecta a codificação da entrada a partir da amostra inicial do arquivo.
+
+        Returns:
+            str: 'utf-8-sig' se a amostra for UTF-8 válido, senão ``ENCODING_ALTERNATIVO``.
+        """
+        with open(self.caminho_entrada, 'rb') as f:
+            amostra = f.read(TAMANHO_AMOSTRA_IDENTIFICACAO)
+        try:
+            # final=False tolera um caractere multibyte cortado no fim da amostra
+            codecs.getincrementaldecoder('utf-8')().decode(amostra, final=False)
+            return 'utf-8-sig'
+        except UnicodeDecodeError:
+            return ENCODING_ALTERNATIVO
+
+    def _verificar_codificacao(self, linha: tuple):
+        """
+        Rejeita linhas com bytes que não puderam ser decodificados.
+
+        Args:
+            linha (tuple): Campos lidos da entrada.
+
+        Raises:
+            ValueError: Se algum campo contiver bytes inválidos para a codificação da entrada.
+        """
+        for campo in linha:
+            if any('\udc80' <= caractere <= '\udcff' for caractere in campo):
+                raise ValueError(f"Linha contém caracteres inválidos para a codificação {self.encoding}")
+
+    def _ler_linhas(self) -> Iterator[tuple]:
+        """
+        Lê a entrada em streaming, conforme a extensão do arquivo.
+
+        Bytes inválidos para a codificação são preservados como substitutos
+        (``surrogateescape``) para que a linha seja rejeitada sem interromper a leitura.
+
+        Yields:
+            tuple: Nome e validade (texto) de cada linha da entrada.
+        """
+        if self.caminho_entrada.lower().endswith(EXTENSOES_JSONL):
+            yield from self._ler_jsonl()
+        else:
+            yield from self._ler_csv()
+
+    def _ler_jsonl(self) -> Iterator[tuple]:
+        """
+        Lê um arquivo JSON Lines com um objeto por linha.
+
+        Yields:
+            tuple: Nome e validade de cada objeto. Linhas inválidas geram campos vazios
+            para que sejam rejeitadas sem deslocar a contagem do checkpoint.
+        """
+        with open(self.caminho_entrada, 'r', encoding=self.encoding, errors='surrogateescape') as f:
+            for linha in f:
+                if not linha.strip():
+                    continue
+                try:
+                    registro = json.loads(linha)
+                except json.JSONDecodeError:
+                    registro = None
+                if not isinstance(registro, dict):
+                    yield '', ''
+                    continue
+                registro = {str(k).strip().lower(): v for k, v in registro.items()}
+                yield self._extrair_campos(registro)
+
+    def _ler_csv(self) -> Iterator[tuple]:
+        """
+        Lê um arquivo CSV com cabeçalho, detectando o separador (',' ou ';' do Excel).
+
+        Yields:
+            tuple: Nome e validade de cada linha.
+        """
+        with open(self.caminho_entrada, 'r', encoding=self.encoding, errors='surrogateescape', newline='') as f:
+            amostra = f.read(64 * 1024)
+            f.seek(0)
+            try:
+                dialeto = csv.Sniffer().sniff(amostra, delimiters=',;\t')
+            except csv.Error:
+                dialeto = csv.excel
+
+            leitor = csv.DictReader(f, dialect=dialeto)
+            if leitor.fieldnames is None:
+                return
+            leitor.fieldnames = [(campo or '').strip().lower() for campo in leitor.fieldnames]
+            if not any(coluna in leitor.fieldnames for coluna in COLUNAS_NOME):
+                raise ValueError(f"Coluna de nome não encontrada. Colunas aceitas: {', '.join(COLUNAS_NOME)}")
+
+            for registro in leitor:
+                yield self._extrair_campos(registro)
+
+    @staticmethod
+    def _extrair_campos(registro: dict) -> tuple:
+        """
+        Extrai nome e validade de um registro usando os nomes de coluna aceitos.
+
+        Args:
+            registro (dict): Registro com chaves em minúsculas.
+
+        Returns:
+            tuple: Nome e validade como texto.
+        """
+        nome = next((registro[c] for c in COLUNAS_NOME if registro.get(c) not in (None, '')), '')
+        validade = next((registro[c] for c in COLUNAS_VALIDADE if registro.get(c) not in (None, '')), '')
+        return str(nome), str(validade)
+
+
+def main():
+    """
+    Ponto de entrada para importar uma lista de clientes pela linha de comando.
+    """
+    from src.frontend.controllers.licence_controller import LicenceController
+
+    parser = argparse.ArgumentParser(description="Importa uma lista de clientes e gera as licenças em lote.")
+    parser.add_argument('entrada', help="Arquivo CSV ou JSONL com a lista de clientes")
+    parser.add_argument('saida', help="Arquivo JSONL onde as licenças serão gravadas")
+    parser.add_argument('--estado', help="Banco de checkpoint e deduplicação (padrão: <saida>.estado.sqlite)")
+    parser.add_argument('--lote', type=int, default=1000, help="Linhas processadas por lote (padrão: 1000)")
+    parser.add_argument('--encoding', help="Codificação da entrada (padrão: detectar entre UTF-8 e cp1252)")
+    args = parser.parse_args()
+
+    importador = ImportadorClientes(
+        LicenceController(None), args.entrada, args.saida,
+        caminho_estado=args.estado, tamanho_lote=args.lote, encoding=args.encoding
+    )
+    estatisticas = importador.executar()
+    print(
+        f"✅ {estatisticas['emitidas']} licenças emitidas "
+        f"({estatisticas['duplicadas']} duplicadas, {estatisticas['rejeitadas']} rejeitadas)"
+    )
+
+
+if __name__ == "__main__":
+    main()
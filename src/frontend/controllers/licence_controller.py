@@ -2,6 +2,7 @@ import os
 import sys
 import json
 import base64
+import threading
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 import tkinter as tk
@@ -46,23 +47,11 @@ class LicenceController:
         Permite ao usuário escolher onde salvar o arquivo de licença.
         """
         try:
-            # Obter dados dos campos
-            nome = self.view.entry_nome.get().strip()
-
-            # Validar campos
-            if not nome:
-                raise ValueError("Nome do cliente é obrigatório")
-
-            # Obter validade
-            dias_validade = 30  # Padrão
-            validade_input = self.view.entry_validade.get().strip()
-            if validade_input:
-                try:
-                    dias_validade = int(validade_input)
-                    if dias_validade <= 0:
-                        raise ValueError("Validade deve ser um número positivo")
-                except ValueError:
-                    raise ValueError("Validade deve ser um número inteiro")
+            # Obter e validar dados dos campos
+            nome, dias_validade = self.validar_dados(
+                self.view.entry_nome.get(),
+                self.view.entry_validade.get()
+            )
 
             # Gerar licença
             licenca = self._criar_licenca(nome, dias_validade)
@@ -110,6 +99,100 @@ class LicenceController:
             self.view.atualizar_status("Erro ao gerar licença", sucesso=False)
             logger.error(f"Erro inesperado na geração de licença: {e}")
     
+    def importar_clientes(self):
+        """
+        Importa uma lista de clientes (CSV ou JSONL) e gera as licenças em lote.
+        Permite ao usuário escolher o arquivo de entrada e onde salvar as licenças.
+        A importação é executada em segundo plano e pode ser retomada após falhas.
+        O botão de importação fica desabilitado até a importação terminar.
+        """
+        from src.backend.importador_clientes import ImportadorClientes
+
+        if not os.path.exists(self._caminho_chave_privada()):
+            self.view.atualizar_status("Gere as chaves antes de importar clientes", sucesso=False)
+            return
+
+        # Abrir janelas para o usuário escolher a entrada e a saída
+        root = tk.Tk()
+        root.withdraw()
+        caminho_entrada = filedialog.askopenfilename(
+            filetypes=[("Listas de clientes", "*.csv *.jsonl *.ndjson"), ("Todos os arquivos", "*.*")],
+            title="Selecionar lista de clientes..."
+        )
+        caminho_saida = None
+        if caminho_entrada:
+            caminho_saida = filedialog.asksaveasfilename(
+                defaultextension=".jsonl",
+                filetypes=[("Licenças em lote", "*.jsonl"), ("Todos os arquivos", "*.*")],
+                initialfile=f"{os.path.splitext(os.path.basename(caminho_entrada))[0]}_licencas.jsonl",
+                title="Salvar licenças como..."
+            )
+        root.destroy()
+
+        if not caminho_entrada or not caminho_saida:
+            self.view.atualizar_status("Importação cancelada pelo usuário.", sucesso=False)
+            return
+
+        def finalizar(mensagem: str, sucesso: bool = True):
+            self.view.botao_importar_clientes.configure(state="normal")
+            self.view.atualizar_status(mensagem, sucesso=sucesso)
+
+        def executar():
+            try:
+                estatisticas = ImportadorClientes(self, caminho_entrada, caminho_saida).executar()
+                mensagem = (
+                    f"{estatisticas['emitidas']} licenças geradas em {caminho_saida} "
+                    f"({estatisticas['duplicadas']} duplicadas, {estatisticas['rejeitadas']} rejeitadas)"
+                )
+                self.view.after(0, finalizar, mensagem)
+            except Exception as e:
+                self.view.after(0, finalizar, f"Erro na importação: {e}", False)
+
+        # Impedir uma segunda importação simultânea sobre a mesma saída e estado
+        self.view.botao_importar_clientes.configure(state="disabled")
+        self.view.atualizar_status("Importando clientes...")
+        threading.Thread(target=executar, daemon=True).start()
+
+    @staticmethod
+    def validar_dados(nome: str, validade_input: str) -> tuple:
+        """
+        Valida o nome do cliente e a validade informada para a licença.
+        
+        Args:
+            nome (str): Nome do cliente.
+            validade_input (str): Validade em dias. Vazio utiliza o padrão de 30 dias.
+        
+        Returns:
+            tuple: Nome normalizado e número de dias de validade.
+        
+        Raises:
+            ValueError: Se o nome estiver vazio, a validade não for um inteiro positivo
+                ou a data de expiração ultrapassar a data máxima suportada.
+        """
+        # Validar nome
+        nome = (nome or "").strip()
+        if not nome:
+            raise ValueError("Nome do cliente é obrigatório")
+
+        # Obter validade
+        dias_validade = 30  # Padrão
+        validade_input = (validade_input or "").strip()
+        if validade_input:
+            try:
+                dias_validade = int(validade_input)
+                if dias_validade <= 0:
+                    raise ValueError("Validade deve ser um número positivo")
+            except ValueError:
+                raise ValueError("Validade deve ser um número inteiro")
+
+            # Garantir que a data de expiração pode ser representada
+            try:
+                datetime.now() + timedelta(days=dias_validade)
+            except OverflowError:
+                raise ValueError("Validade excede a data máxima permitida")
+
+        return nome, dias_validade
+
     def gerar_chaves(self) -> tuple:
         """
         Gera um par de chaves RSA e permite ao usuário escolher onde salvar os arquivos.
@@ -170,32 +253,52 @@ class LicenceController:
             logger.error(f"Erro ao gerar chaves: {e}")
             raise
     
-    def _criar_licenca(self, nome: str, dias_validade: int = 30) -> dict:
+    def _caminho_chave_privada(self) -> str:
+        """
+        Retorna o caminho padrão da chave privada.
+        
+        Returns:
+            str: Caminho do arquivo chave_privada.pem.
+        """
+        base_dir = os.path.join(
+            os.path.dirname(__file__), 
+            '..', '..', '..')
+        dir_chaves = os.path.join(base_dir, 'chaves')
+        return os.path.join(dir_chaves, 'chave_privada.pem')
+    
+    def _carregar_chave_privada(self):
+        """
+        Carrega a chave privada, gerando um novo par de chaves se ela não existir.
+        
+        Returns:
+            RSAPrivateKey: Chave privada usada para assinar as licenças.
+        """
+        caminho_privada = self._caminho_chave_privada()
+        
+        # Verificar se a chave existe, se não, gerar
+        if not os.path.exists(caminho_privada):
+            self.gerar_chaves()
+        
+        # Carregar chave privada
+        with open(caminho_privada, 'rb') as f:
+            return serialization.load_pem_private_key(f.read(), password=None)
+    
+    def _criar_licenca(self, nome: str, dias_validade: int = 30, private_key=None) -> dict:
         """
         Cria uma licença assinada digitalmente.
         
         Args:
             nome (str): Nome do cliente.
             dias_validade (int, optional): Número de dias de validade. Padrão é 30.
+            private_key (RSAPrivateKey, optional): Chave já carregada. Se omitida,
+                a chave é lida do disco a cada chamada.
         
         Returns:
             dict: Dicionário com detalhes da licença.
         """
         try:
-            # Definir caminho para chave privada
-            base_dir = os.path.join(
-                os.path.dirname(__file__), 
-                '..', '..', '..')
-            dir_chaves = os.path.join(base_dir, 'chaves')
-            caminho_privada = os.path.join(dir_chaves, 'chave_privada.pem')
-            
-            # Verificar se a chave existe, se não, gerar
-            if not os.path.exists(caminho_privada):
-                self.gerar_chaves()
-            
-            # Carregar chave privada
-            with open(caminho_privada, 'rb') as f:
-                private_key = serialization.load_pem_private_key(f.read(), password=None)
+            if private_key is None:
+                private_key = self._carregar_chave_privada()
             
             # Calcular data de validade
             data_validade = (datetime.now() + timedelta(days=dias_validade)).strftime("%Y-%m-%d")
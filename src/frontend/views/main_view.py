@@ -25,7 +25,7 @@ class MainView(ctk.CTk):
         
         # Configurações da janela
         self.title("Gerador de Licenças")
-        self.geometry("600x500")
+        self.geometry("600x560")
 
         # Adicionar ícone do app
         try:
@@ -111,6 +111,14 @@ class MainView(ctk.CTk):
         )
         self.botao_gerar_licenca.pack(pady=10, padx=20, fill="x")
         
+        # Botão para importar lista de clientes
+        self.botao_importar_clientes = ctk.CTkButton(
+            self.frame_principal, 
+            text="Importar Clientes", 
+            command=self.controller.importar_clientes
+        )
+        self.botao_importar_clientes.pack(pady=10, padx=20, fill="x")
+        
         # Botão para listar licenças
         self.botao_listar_licencas = ctk.CTkButton(
             self.frame_principal, 
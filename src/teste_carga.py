@@ -0,0 +1,473 @@
+import os
+import sys
+import json
+import math
+import queue
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+import contextlib
+import multiprocessing
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Adicionar o diretório raiz ao path para importações
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.hazmat.primitives import serialization
+
+from src.validar_licenca import validar_licenca
+
+# Resultado esperado de validar_licenca para cada tipo de licença do corpus
+TIPOS_LICENCA = {
+    'valida': True,
+    'expirada': False,
+    'adulterada': False,
+}
+
+# Histograma de latência em escala logarítmica: cada faixa é 10% maior que a anterior
+FATOR_HISTOGRAMA = 1.1
+
+
+def gerar_corpus(diretorio: str, quantidade: int, proporcoes: dict) -> list:
+    """
+    Gera um par de chaves descartável e um corpus de licenças para o teste.
+
+    Args:
+        diretorio (str): Diretório onde as chaves e licenças serão gravadas.
+        quantidade (int): Número total de licenças.
+        proporcoes (dict): Peso de cada tipo de licença ('valida', 'expirada', 'adulterada').
+
+    Returns:
+        list: Tuplas (caminho da licença, tipo) do corpus.
+    """
+    # Chave própria do teste para não depender da chave de produção
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    with open(os.path.join(diretorio, 'chave_publica.pem'), 'wb') as f:
+        f.write(private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        ))
+
+    total_pesos = sum(proporcoes.values())
+    if total_pesos <= 0:
+        raise ValueError("Ao menos um tipo de licença deve ter proporção positiva")
+
+    # Importado apenas no processo principal: os clientes carregam somente o que um cliente real carrega
+    from src.frontend.controllers.licence_controller import LicenceController
+
+    controller = LicenceController(None)
+    corpus = []
+    for tipo, peso in proporcoes.items():
+        for i in range(round(quantidade * peso / total_pesos)):
+            dias_validade = -1 if tipo == 'expirada' else 30
+            pacote = controller._criar_licenca(f"CLIENTE_{tipo.upper()}_{i}", dias_validade, private_key)
+            if tipo == 'adulterada':
+                pacote['licenca']['validade'] = "2099-12-31"
+
+            caminho = os.path.join(diretorio, f"{tipo}_{i}.lic")
+            with open(caminho, 'w') as f:
+                json.dump(pacote, f)
+            corpus.append((caminho, tipo))
+
+    if not corpus:
+        raise ValueError("Corpus vazio: aumente o tamanho do corpus ou ajuste as proporções")
+
+    return corpus
+
+
+def _faixa_latencia(segundos: float) -> int:
+    """
+    Calcula a faixa do histograma correspondente a uma latência.
+
+    Args:
+        segundos (float): Latência medida.
+
+    Returns:
+        int: Índice da faixa (microssegundos em escala logarítmica).
+    """
+    return int(math.log(max(segundos * 1e6, 1.0), FATOR_HISTOGRAMA))
+
+
+def _percentil(histograma: dict, percentil: float) -> float:
+    """
+    Estima um percentil a partir do histograma de latências.
+
+    Args:
+        histograma (dict): Contagem por faixa.
+        percentil (float): Percentil desejado, entre 0 e 100.
+
+    Returns:
+        float: Limite superior da faixa em milissegundos.
+    """
+    total = sum(histograma.values())
+    if not total:
+        return 0.0
+    alvo = math.ceil(total * percentil / 100)
+    acumulado = 0
+    for faixa in sorted(histograma):
+        acumulado += histograma[faixa]
+        if acumulado >= alvo:
+            return FATOR_HISTOGRAMA ** (faixa + 1) / 1000
+    return 0.0
+
+
+def _uso_recursos() -> tuple:
+    """
+    Mede CPU consumida e memória residente máxima do processo atual.
+
+    Returns:
+        tuple: Segundos de CPU e RSS máximo em KB (None se indisponível).
+    """
+    if resource is None:
+        return time.process_time(), None
+
+    uso = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss é informado em bytes no macOS e em KB no Linux
+    rss_kb = uso.ru_maxrss // 1024 if sys.platform == 'darwin' else uso.ru_maxrss
+
+    # No Linux, ru_maxrss herda o pico do processo principal através do fork/exec do
+    # 'spawn'; VmHWM mede apenas a memória do próprio cliente
+    try:
+        with open('/proc/self/status') as f:
+            for linha in f:
+                if linha.startswith('VmHWM:'):
+                    rss_kb = int(linha.split()[1])
+                    break
+    except OSError:
+        pass
+
+    return uso.ru_utime + uso.ru_stime, rss_kb
+
+
+def _executar_processo(indice: int, corpus: list, caminho_chave_publica: str, threads: int,
+                       iteracoes: int, barreira, fila):
+    """
+    Executa as validações de um processo cliente e envia o resultado ao processo principal.
+
+    Args:
+        indice (int): Número do processo.
+        corpus (list): Licenças (caminho, tipo) a validar.
+        caminho_chave_publica (str): Chave pública usada na validação.
+        threads (int): Threads de validação neste processo.
+        iteracoes (int): Validações realizadas por thread.
+        barreira (multiprocessing.Barrier): Sincroniza o início de todos os processos.
+        fila (multiprocessing.Queue): Fila para envio do resultado.
+    """
+    histogramas = {tipo: {} for tipo in TIPOS_LICENCA}
+    divergencias = {tipo: 0 for tipo in TIPOS_LICENCA}
+    excecoes = {tipo: 0 for tipo in TIPOS_LICENCA}
+    maximos = {tipo: 0.0 for tipo in TIPOS_LICENCA}
+    falhas_threads = []
+    trava = threading.Lock()
+
+    def validar(numero_thread: int):
+        locais = {tipo: {} for tipo in TIPOS_LICENCA}
+        erros = {tipo: 0 for tipo in TIPOS_LICENCA}
+        levantadas = {tipo: 0 for tipo in TIPOS_LICENCA}
+        mais_lentas = {tipo: 0.0 for tipo in TIPOS_LICENCA}
+        deslocamento = (indice * threads + numero_thread) * iteracoes
+        try:
+            for i in range(iteracoes):
+                caminho, tipo = corpus[(deslocamento + i) % len(corpus)]
+                t0 = time.perf_counter()
+                try:
+                    resultado = validar_licenca(caminho, caminho_chave_publica)
+                except Exception:
+                    levantadas[tipo] += 1
+                    continue
+                latencia = time.perf_counter() - t0
+                faixa = _faixa_latencia(latencia)
+                locais[tipo][faixa] = locais[tipo].get(faixa, 0) + 1
+                mais_lentas[tipo] = max(mais_lentas[tipo], latencia)
+                if resultado != TIPOS_LICENCA[tipo]:
+                    erros[tipo] += 1
+        except Exception as e:
+            # Registrar a falha no relatório em vez de perdê-la no stderr da thread
+            with trava:
+                falhas_threads.append(f"thread {numero_thread}: {e!r}")
+
+        finally:
+            with trava:
+                for tipo in TIPOS_LICENCA:
+                    for faixa, contagem in locais[tipo].items():
+                        histogramas[tipo][faixa] = histogramas[tipo].get(faixa, 0) + contagem
+                    divergencias[tipo] += erros[tipo]
+                    excecoes[tipo] += levantadas[tipo]
+                    maximos[tipo] = max(maximos[tipo], mais_lentas[tipo])
+
+    # Aguardar todos os processos terminarem de importar os módulos antes de começar
+    try:
+        barreira.wait()
+    except threading.BrokenBarrierError:
+        # Outro processo falhou antes do início; o principal registra a falha
+        return
+    cpu_inicial, _ = _uso_recursos()
+    inicio = time.time()
+    t0 = time.perf_counter()
+
+    # validar_licenca imprime o resultado de cada chamada; descartar essa saída
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        trabalhadores = [threading.Thread(target=validar, args=(n,)) for n in range(threads)]
+        for trabalhador in trabalhadores:
+            trabalhador.start()
+        for trabalhador in trabalhadores:
+            trabalhador.join()
+
+    duracao = time.perf_counter() - t0
+    fim = time.time()
+    cpu_final, rss_kb = _uso_recursos()
+    fila.put({
+        'processo': indice,
+        'inicio': inicio,
+        'fim': fim,
+        'duracao': duracao,
+        'cpu_segundos': cpu_final - cpu_inicial,
+        'rss_max_kb': rss_kb,
+        'histogramas': histogramas,
+        'divergencias': divergencias,
+        'excecoes': excecoes,
+        'maximos': maximos,
+        'falhas_threads': falhas_threads,
+    })
+
+
+def executar_carga(processos: int = 4, threads: int = 4, iteracoes: int = 100, corpus_tamanho: int = 100,
+                   proporcoes: dict = None) -> dict:
+    """
+    Simula vários clientes validando licenças ao mesmo tempo e gera um relatório.
+
+    Args:
+        processos (int, optional): Processos cliente simultâneos. Padrão é 4.
+        threads (int, optional): Threads por processo. Padrão é 4.
+        iteracoes (int, optional): Validações por thread. Padrão é 100.
+        corpus_tamanho (int, optional): Licenças geradas para o corpus. Padrão é 100.
+        proporcoes (dict, optional): Peso de cada tipo de licença. Padrão é 80% válidas,
+            10% expiradas e 10% adulteradas.
+
+    Returns:
+        dict: Relatório com vazão, percentis de latência, CPU e RSS por processo, falhas
+            registradas e o indicador geral de sucesso.
+    """
+    if min(processos, threads, iteracoes, corpus_tamanho) <= 0:
+        raise ValueError("Processos, threads, iterações e tamanho do corpus devem ser positivos")
+    proporcoes = proporcoes or {'valida': 8, 'expirada': 1, 'adulterada': 1}
+
+    diretorio = tempfile.mkdtemp(prefix='teste_carga_')
+    try:
+        corpus = gerar_corpus(diretorio, corpus_tamanho, proporcoes)
+        caminho_chave_publica = os.path.join(diretorio, 'chave_publica.pem')
+
+        # 'spawn' se comporta igual em Windows, macOS e Linux
+        contexto = multiprocessing.get_context('spawn')
+        barreira = contexto.Barrier(processos + 1)
+        fila = contexto.Queue()
+        clientes = [
+            contexto.Process(
+                target=_executar_processo,
+                args=(i, corpus, caminho_chave_publica, threads, iteracoes, barreira, fila)
+            )
+            for i in range(processos)
+        ]
+        for cliente in clientes:
+            cliente.start()
+
+        # Liberar os processos somente quando todos estiverem prontos
+        abortado = False
+        while barreira.n_waiting < processos:
+            if any(cliente.exitcode is not None for cliente in clientes):
+                barreira.abort()
+                abortado = True
+                break
+            time.sleep(0.05)
+        else:
+            barreira.wait()
+
+        resultados = _coletar_resultados(clientes, fila)
+        for cliente in clientes:
+            cliente.join()
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+
+    recebidos = {r['processo'] for r in resultados}
+    falhas_processos = [
+        f"processo {i}: não iniciou porque outro processo falhou antes do início"
+        if abortado and cliente.exitcode == 0 else
+        f"processo {i}: encerrado com código {cliente.exitcode} sem enviar resultados"
+        for i, cliente in enumerate(clientes) if i not in recebidos
+    ]
+    return _montar_relatorio(resultados, falhas_processos, processos, threads, iteracoes, corpus_tamanho, proporcoes)
+
+
+def _coletar_resultados(clientes: list, fila) -> list:
+    """
+    Recebe os resultados dos processos cliente sem bloquear se algum deles morrer.
+
+    Args:
+        clientes (list): Processos cliente iniciados.
+        fila (multiprocessing.Queue): Fila onde os clientes enviam os resultados.
+
+    Returns:
+        list: Resultados recebidos; processos que falharam não aparecem.
+    """
+    resultados = []
+    while len(resultados) < len(clientes):
+        try:
+            resultados.append(fila.get(timeout=1))
+        except queue.Empty:
+            if not any(cliente.is_alive() for cliente in clientes):
+                # Esvaziar o que ainda estiver na fila antes de desistir
+                try:
+                    while len(resultados) < len(clientes):
+                        resultados.append(fila.get(timeout=0.5))
+                except queue.Empty:
+                    break
+    return resultados
+
+
+def _montar_relatorio(resultados: list, falhas_processos: list, processos: int, threads: int, iteracoes: int,
+                      corpus_tamanho: int, proporcoes: dict) -> dict:
+    """
+    Consolida os resultados dos processos em um relatório.
+
+    A duração considera apenas o trabalho dos clientes, do primeiro início à
+    última conclusão, sem incluir a criação dos processos e a importação dos módulos.
+
+    Returns:
+        dict: Relatório da execução.
+    """
+    duracao = max(r['fim'] for r in resultados) - min(r['inicio'] for r in resultados) if resultados else 0.0
+    latencias = {}
+    histograma_total = {}
+    for tipo in TIPOS_LICENCA:
+        histograma = {}
+        for resultado in resultados:
+            # Chaves de faixa podem chegar como texto após serialização
+            for faixa, contagem in resultado['histogramas'][tipo].items():
+                histograma[int(faixa)] = histograma.get(int(faixa), 0) + contagem
+        for faixa, contagem in histograma.items():
+            histograma_total[faixa] = histograma_total.get(faixa, 0) + contagem
+        latencias[tipo] = _resumo_latencia(histograma, max((r['maximos'][tipo] for r in resultados), default=0.0))
+        latencias[tipo]['divergencias'] = sum(r['divergencias'][tipo] for r in resultados)
+        latencias[tipo]['excecoes'] = sum(r['excecoes'][tipo] for r in resultados)
+    latencias['total'] = _resumo_latencia(
+        histograma_total, max((r['maximos'][tipo] for r in resultados for tipo in TIPOS_LICENCA), default=0.0)
+    )
+
+    total = latencias['total']['validacoes']
+    divergencias = sum(latencias[tipo]['divergencias'] for tipo in TIPOS_LICENCA)
+    excecoes = sum(latencias[tipo]['excecoes'] for tipo in TIPOS_LICENCA)
+    falhas = falhas_processos + [
+        f"processo {r['processo']}, {falha}" for r in resultados for falha in r['falhas_threads']
+    ]
+    rss = [r['rss_max_kb'] for r in resultados if r['rss_max_kb'] is not None]
+    return {
+        'data': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'configuracao': {
+            'processos': processos,
+            'threads': threads,
+            'iteracoes': iteracoes,
+            'corpus': corpus_tamanho,
+            'proporcoes': proporcoes,
+        },
+        'duracao_segundos': round(duracao, 3),
+        'validacoes_por_segundo': round(total / duracao, 1) if duracao else 0.0,
+        'latencia_ms': latencias,
+        'cpu_segundos': round(sum(r['cpu_segundos'] for r in resultados), 3),
+        'rss_max_kb': max(rss) if rss else None,
+        'falhas': falhas,
+        'sucesso': total > 0 and not (divergencias or excecoes or falhas),
+        'processos': [
+            {
+                'processo': r['processo'],
+                'duracao_segundos': round(r['duracao'], 3),
+                'cpu_segundos': round(r['cpu_segundos'], 3),
+                'rss_max_kb': r['rss_max_kb'],
+            }
+            for r in sorted(resultados, key=lambda r: r['processo'])
+        ],
+    }
+
+
+def _resumo_latencia(histograma: dict, maximo: float) -> dict:
+    """
+    Resume um histograma de latências em contagem e percentis.
+
+    Os percentis são estimados pelo limite superior da faixa do histograma
+    (até 10% acima do valor real), limitados ao máximo, que é o valor medido.
+
+    Args:
+        histograma (dict): Contagem por faixa.
+        maximo (float): Maior latência medida, em segundos.
+
+    Returns:
+        dict: Número de validações e percentis p50, p90, p99 e máximo em milissegundos.
+    """
+    return {
+        'validacoes': sum(histograma.values()),
+        'p50': round(min(_percentil(histograma, 50), maximo * 1000), 3),
+        'p90': round(min(_percentil(histograma, 90), maximo * 1000), 3),
+        'p99': round(min(_percentil(histograma, 99), maximo * 1000), 3),
+        'max': round(maximo * 1000, 3),
+    }
+
+
+def main():
+    """
+    Ponto de entrada para executar o teste de carga pela linha de comando.
+    """
+    parser = argparse.ArgumentParser(description="Simula validações de licença simultâneas em vários clientes.")
+    parser.add_argument('--processos', type=int, default=4, help="Processos cliente simultâneos (padrão: 4)")
+    parser.add_argument('--threads', type=int, default=4, help="Threads por processo (padrão: 4)")
+    parser.add_argument('--iteracoes', type=int, default=100, help="Validações por thread (padrão: 100)")
+    parser.add_argument('--corpus', type=int, default=100, help="Licenças geradas para o teste (padrão: 100)")
+    parser.add_argument('--validas', type=float, default=8, help="Peso de licenças válidas (padrão: 8)")
+    parser.add_argument('--expiradas', type=float, default=1, help="Peso de licenças expiradas (padrão: 1)")
+    parser.add_argument('--adulteradas', type=float, default=1, help="Peso de licenças adulteradas (padrão: 1)")
+    parser.add_argument('--saida', help="Arquivo JSON onde o relatório será salvo")
+    args = parser.parse_args()
+
+    relatorio = executar_carga(
+        processos=args.processos,
+        threads=args.threads,
+        iteracoes=args.iteracoes,
+        corpus_tamanho=args.corpus,
+        proporcoes={'valida': args.validas, 'expirada': args.expiradas, 'adulterada': args.adulteradas},
+    )
+
+    if args.saida:
+        with open(args.saida, 'w') as f:
+            json.dump(relatorio, f, indent=4)
+
+    print(f"Validações: {relatorio['latencia_ms']['total']['validacoes']} "
+          f"em {relatorio['duracao_segundos']} s ({relatorio['validacoes_por_segundo']}/s)")
+    for tipo, resumo in relatorio['latencia_ms'].items():
+        print(f"  {tipo:<10} p50={resumo['p50']} ms  p90={resumo['p90']} ms  "
+              f"p99={resumo['p99']} ms  max={resumo['max']} ms")
+    print(f"CPU: {relatorio['cpu_segundos']} s  RSS máximo: {relatorio['rss_max_kb']} KB")
+
+    divergencias = sum(relatorio['latencia_ms'][tipo]['divergencias'] for tipo in TIPOS_LICENCA)
+    excecoes = sum(relatorio['latencia_ms'][tipo]['excecoes'] for tipo in TIPOS_LICENCA)
+    for falha in relatorio['falhas']:
+        print(f"❌ Falha em {falha}")
+    if divergencias:
+        print(f"❌ {divergencias} validações retornaram resultado diferente do esperado")
+    if excecoes:
+        print(f"❌ {excecoes} validações levantaram exceção")
+    if not relatorio['latencia_ms']['total']['validacoes']:
+        print("❌ Nenhuma validação foi concluída")
+
+    if not relatorio['sucesso']:
+        sys.exit(1)
+    print("✅ Todas as validações retornaram o resultado esperado")
+
+
+if __name__ == "__main__":
+    main()